@@ -1,21 +1,20 @@
 import asyncio
+import sys
 from ai_content.providers.google.imagen import GoogleImagenProvider
 from ai_content.config import configure
 
-async def main():
-    # Ensure config is loaded (to get env vars)
-    configure('configs/default.yaml')
-    
-    provider = GoogleImagenProvider()
-    print("Generating image with Imagen...")
+DEFAULT_PROMPT = "A futuristic city with neon lights, cinematic, 8k"
+
+
+async def generate_one(provider, prompt, output_path):
     try:
         result = await provider.generate(
-            prompt="A futuristic city with neon lights, cinematic, 8k",
+            prompt=prompt,
             aspect_ratio="16:9",
-            output_path="output/image/city.png",
+            output_path=output_path,
             use_gemini=True
         )
-        
+
         if result.success:
             print(f"Success! Saved to {result.file_path}")
         else:
@@ -23,5 +22,24 @@ async def main():
     except Exception as e:
         print(f"Error: {e}")
 
+
+async def main(prompts):
+    # Ensure config is loaded (to get env vars)
+    configure('configs/default.yaml')
+
+    if prompts:
+        output_paths = [f"output/image/image_{i}.png" for i in range(len(prompts))]
+    else:
+        prompts = [DEFAULT_PROMPT]
+        output_paths = ["output/image/city.png"]
+
+    # One provider (and GenAI client) shared by all prompts, requests run concurrently.
+    provider = GoogleImagenProvider()
+    print(f"Generating {len(prompts)} image(s) with Imagen...")
+    async with asyncio.TaskGroup() as tg:
+        for prompt, output_path in zip(prompts, output_paths, strict=True):
+            tg.create_task(generate_one(provider, prompt, output_path))
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Usage: python generate_image.py ["prompt one" "prompt two" ...]
+    asyncio.run(main(sys.argv[1:]))
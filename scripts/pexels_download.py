@@ -11,23 +11,55 @@ Auth:
 
 Examples:
   uv run python scripts/pexels_download.py video --query "nature" --output output/video/pexels_nature.mp4
+  uv run python scripts/pexels_download.py video --query "ocean" --count 4 --output output/video/
   uv run python scripts/pexels_download.py photo --query "sunset mountains" --output output/images/pexels_sunset.jpg
+
+Batch pipelines should import this module and call `main([...])` (or the
+`download_*` coroutines) in one process rather than spawning the script per
+item; the parser is built once and reused.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import importlib.util
+import itertools
 import json
 import os
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
+
 
 PEXELS_BASE = "https://api.pexels.com"
 
+# Large stream chunks keep the per-chunk Python overhead and write syscalls low on
+# multi-MB video downloads; each chunk goes straight to the fd with no extra buffering.
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Only this much of an error response body is decoded for the diagnostic message.
+ERROR_BODY_PREVIEW = 2048
+
+# Minimum seconds between progress updates; printing per chunk would dominate the loop.
+PROGRESS_INTERVAL = 0.5
+
+# Upper bound on concurrent media streams when downloading several items (--count).
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Directories already created in this process; media and metadata share a parent.
+_ENSURED_DIRS: set[Path] = set()
+
 
 @dataclass(frozen=True)
 class DownloadResult:
@@ -36,6 +68,7 @@ class DownloadResult:
     attribution: str
 
 
+@functools.lru_cache(maxsize=1)
 def _get_api_key() -> str:
     api_key = os.getenv("PIXEL_API_KEY") or os.getenv("PEXELS_API_KEY")
     if not api_key:
@@ -57,27 +90,103 @@ def _pick_best_video_file(video_files: list[dict[str, Any]]) -> dict[str, Any] |
         return None
 
     def score(vf: dict[str, Any]) -> tuple[int, int]:
-        return (int(vf.get("width") or 0), int(vf.get("height") or 0))
+        return (vf.get("width") or 0, vf.get("height") or 0)
+
+    return max(mp4s, key=score)
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
-    return sorted(mp4s, key=score, reverse=True)[0]
+
+def _within_duration(video: dict[str, Any], min_duration: int | None, max_duration: int | None) -> bool:
+    duration = video.get("duration")
+    if not isinstance(duration, int):
+        return True
+    if min_duration is not None and duration < min_duration:
+        return False
+    return max_duration is None or duration <= max_duration
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def _safe_write_json(path: Path, obj: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2, sort_keys=True), encoding="utf-8")
+    _ensure_dir(path.parent)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        path.write_text(json.dumps(obj, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _make_client() -> httpx.AsyncClient:
+    # HTTP/2 needs the optional `h2` package (`httpx[http2]`); fall back to HTTP/1.1 keep-alive.
+    # No default headers: the API key goes only on Pexels API calls, never to the media hosts.
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=httpx.Timeout(30.0, read=120.0),
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
 
 
-def _download_to(url: str, output_path: Path) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with httpx.Client(timeout=120.0, follow_redirects=True) as client:
-        with client.stream("GET", url) as resp:
-            resp.raise_for_status()
-            with output_path.open("wb") as f:
-                for chunk in resp.iter_bytes():
-                    f.write(chunk)
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
 
 
-def download_video(
+def _prepare_fd(fd: int, size: int) -> None:
+    """Reserve `size` bytes up front and hint sequential access (POSIX only)."""
+    try:
+        if size > 0:
+            os.posix_fallocate(fd, 0, size)
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        # Not available on this platform/filesystem; the file just grows as written.
+        pass
+
+
+async def _download_to(
+    client: httpx.AsyncClient, url: str, output_path: Path, *, show_progress: bool = False
+) -> None:
+    _ensure_dir(output_path.parent)
+    async with client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        size = int(resp.headers.get("content-length") or 0)
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        written = 0
+        complete = False
+        try:
+            _prepare_fd(fd, size)
+            next_report = time.monotonic() + PROGRESS_INTERVAL
+            async for chunk in resp.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                _write_all(fd, chunk)
+                written += len(chunk)
+                if show_progress and time.monotonic() >= next_report:
+                    print(f"\r   {written / 1e6:.1f} MB", end="", flush=True)
+                    next_report = time.monotonic() + PROGRESS_INTERVAL
+            if show_progress:
+                print(f"\r   {written / 1e6:.1f} MB")
+            complete = True
+        finally:
+            try:
+                if complete and written != size:
+                    # Drop the preallocated tail: Content-Length can differ from the decoded body.
+                    os.ftruncate(fd, written)
+            finally:
+                os.close(fd)
+            if not complete:
+                # A failed or cancelled stream must not leave a partial file behind.
+                output_path.unlink(missing_ok=True)
+
+
+async def download_video(
+    client: httpx.AsyncClient,
     *,
     query: str,
     output: Path,
@@ -86,61 +195,114 @@ def download_video(
     index: int,
     min_duration: int | None,
     max_duration: int | None,
-) -> DownloadResult:
+    count: int = 1,
+) -> list[DownloadResult]:
+    if count < 1:
+        raise SystemExit(f"--count must be at least 1, got {count}.")
+    if count > 1 and output.suffix and not output.is_dir():
+        raise SystemExit(
+            f"--output must be a directory when --count is greater than 1, got {output}."
+        )
+
     url = f"{PEXELS_BASE}/videos/search"
     params = {"query": query, "per_page": per_page, "page": page}
 
-    with httpx.Client(timeout=30.0, headers=_headers(), follow_redirects=True) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-        payload = resp.json()
+    resp = await client.get(url, params=params, headers=_headers())
+    resp.raise_for_status()
+    payload = _loads(resp.content)
 
     videos: list[dict[str, Any]] = payload.get("videos") or []
     if not videos:
         raise SystemExit(f"No videos found for query: {query!r}")
 
-    filtered = []
-    for v in videos:
-        duration = v.get("duration")
-        if isinstance(duration, int):
-            if min_duration is not None and duration < min_duration:
-                continue
-            if max_duration is not None and duration > max_duration:
-                continue
-        filtered.append(v)
-
-    candidates = filtered if (min_duration is not None or max_duration is not None) else videos
-    if not candidates:
+    if min_duration is None and max_duration is None:
+        candidates: Iterable[dict[str, Any]] = videos
+    else:
+        candidates = (v for v in videos if _within_duration(v, min_duration, max_duration))
+
+    selected = list(itertools.islice(candidates, index, index + count)) if index >= 0 else []
+    if not selected:
+        available = sum(1 for v in videos if _within_duration(v, min_duration, max_duration))
+        if not available:
+            raise SystemExit(
+                "No videos matched duration filters. "
+                f"Try widening range; got min_duration={min_duration}, max_duration={max_duration}."
+            )
         raise SystemExit(
-            "No videos matched duration filters. "
-            f"Try widening range; got min_duration={min_duration}, max_duration={max_duration}."
+            f"Index out of range. Got {index}, available 0..{available-1} after filtering."
         )
-
-    if index < 0 or index >= len(candidates):
+    if len(selected) < count:
         raise SystemExit(
-            f"Index out of range. Got {index}, available 0..{len(candidates)-1} after filtering."
+            f"Only {len(selected)} of {count} requested videos available from index {index} "
+            "after filtering. Lower --count or --index, or raise --per-page."
         )
 
-    video = candidates[index]
-    best = _pick_best_video_file(video.get("video_files") or [])
-    if not best or not best.get("link"):
-        raise SystemExit("No downloadable video file found in Pexels response.")
+    picks: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    for video in selected:
+        best = _pick_best_video_file(video.get("video_files") or [])
+        if not best or not best.get("link"):
+            raise SystemExit("No downloadable video file found in Pexels response.")
+        picks.append((video, best))
+
+    if count == 1:
+        video, best = picks[0]
+        # If user passed a directory, create a default name.
+        if output.is_dir() or str(output).endswith("/"):
+            output = output / f"pexels_video_{video.get('id','unknown')}.mp4"
+
+        if output.suffix.lower() not in {".mp4", ".mov", ".m4v"}:
+            # Default to mp4 for the chosen link
+            output = output.with_suffix(".mp4")
+
+        return [
+            await _save_video(
+                client, video, best, output, query=query, page=page, index=index, show_progress=True
+            )
+        ]
+
+    # Several items: `output` is a directory and the downloads share the client's pool,
+    # with a cap on how many streams are in flight at once.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async def bounded(offset: int, video: dict[str, Any], best: dict[str, Any]) -> DownloadResult:
+        async with semaphore:
+            return await _save_video(
+                client,
+                video,
+                best,
+                output / f"pexels_video_{video.get('id','unknown')}.mp4",
+                query=query,
+                page=page,
+                index=index + offset,
+            )
 
-    download_url = best["link"]
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(bounded(i, v, b)) for i, (v, b) in enumerate(picks)]
+    except* Exception as eg:
+        # Surface the first failure as-is (HTTP error, ENOSPC, ...) rather than a group.
+        raise eg.exceptions[0] from None
 
-    # If user passed a directory, create a default name.
-    if output.is_dir() or str(output).endswith("/"):
-        output = output / f"pexels_video_{video.get('id','unknown')}.mp4"
+    return [task.result() for task in tasks]
 
-    if output.suffix.lower() not in {".mp4", ".mov", ".m4v"}:
-        # Default to mp4 for the chosen link
-        output = output.with_suffix(".mp4")
 
-    _download_to(download_url, output)
+async def _save_video(
+    client: httpx.AsyncClient,
+    video: dict[str, Any],
+    best: dict[str, Any],
+    output: Path,
+    *,
+    query: str,
+    page: int,
+    index: int,
+    show_progress: bool = False,
+) -> DownloadResult:
+    await _download_to(client, best["link"], output, show_progress=show_progress)
 
+    user = video.get("user") or {}
     attribution = (
         f"Pexels video id={video.get('id')} | url={video.get('url')} | "
-        f"user={((video.get('user') or {}).get('name'))}"
+        f"user={user.get('name')}"
     )
 
     metadata = {
@@ -163,7 +325,7 @@ def download_video(
             "duration": video.get("duration"),
             "width": video.get("width"),
             "height": video.get("height"),
-            "user": video.get("user"),
+            "user": {k: user.get(k) for k in ("id", "name", "url")},
         },
     }
 
@@ -173,14 +335,22 @@ def download_video(
     return DownloadResult(media_path=output, metadata_path=metadata_path, attribution=attribution)
 
 
-def download_photo(*, query: str, output: Path, per_page: int, page: int, index: int, size: str) -> DownloadResult:
+async def download_photo(
+    client: httpx.AsyncClient,
+    *,
+    query: str,
+    output: Path,
+    per_page: int,
+    page: int,
+    index: int,
+    size: str,
+) -> DownloadResult:
     url = f"{PEXELS_BASE}/v1/search"
     params = {"query": query, "per_page": per_page, "page": page}
 
-    with httpx.Client(timeout=30.0, headers=_headers(), follow_redirects=True) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-        payload = resp.json()
+    resp = await client.get(url, params=params, headers=_headers())
+    resp.raise_for_status()
+    payload = _loads(resp.content)
 
     photos: list[dict[str, Any]] = payload.get("photos") or []
     if not photos:
@@ -203,7 +373,7 @@ def download_photo(*, query: str, output: Path, per_page: int, page: int, index:
     if output.suffix.lower() not in {".jpg", ".jpeg", ".png"}:
         output = output.with_suffix(".jpg")
 
-    _download_to(download_url, output)
+    await _download_to(client, download_url, output, show_progress=True)
 
     attribution = f"Pexels photo id={photo.get('id')} | url={photo.get('url')} | photographer={photo.get('photographer')}"
 
@@ -231,7 +401,34 @@ def download_photo(*, query: str, output: Path, per_page: int, page: int, index:
     return DownloadResult(media_path=output, metadata_path=metadata_path, attribution=attribution)
 
 
-def main() -> int:
+async def _run(args: argparse.Namespace) -> list[DownloadResult]:
+    async with _make_client() as client:
+        if args.kind == "video":
+            return await download_video(
+                client,
+                query=args.query,
+                output=args.output,
+                per_page=args.per_page,
+                page=args.page,
+                index=args.index,
+                min_duration=args.min_duration,
+                max_duration=args.max_duration,
+                count=args.count,
+            )
+        result = await download_photo(
+            client,
+            query=args.query,
+            output=args.output,
+            per_page=args.per_page,
+            page=args.page,
+            index=args.index,
+            size=args.size,
+        )
+        return [result]
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Download stock media from Pexels.")
     sub = parser.add_subparsers(dest="kind", required=True)
 
@@ -266,6 +463,13 @@ def main() -> int:
         help="Maximum video duration (seconds) to filter results",
     )
 
+    p_video.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="Download this many consecutive items starting at --index (--output must be a directory)",
+    )
+
     p_photo = sub.add_parser("photo", parents=[common], help="Download a Pexels photo")
     p_photo.add_argument(
         "--size",
@@ -273,39 +477,26 @@ def main() -> int:
         help="Photo size key: original|large2x|large|medium|small|portrait|landscape|tiny",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     try:
-        if args.kind == "video":
-            result = download_video(
-                query=args.query,
-                output=args.output,
-                per_page=args.per_page,
-                page=args.page,
-                index=args.index,
-                min_duration=args.min_duration,
-                max_duration=args.max_duration,
-            )
-        else:
-            result = download_photo(
-                query=args.query,
-                output=args.output,
-                per_page=args.per_page,
-                page=args.page,
-                index=args.index,
-                size=args.size,
-            )
+        results = asyncio.run(_run(args))
 
         print("✅ Downloaded")
-        print(f"   Media: {result.media_path}")
-        print(f"   Meta:  {result.metadata_path}")
-        print(f"   Info:  {result.attribution}")
+        for result in results:
+            print(f"   Media: {result.media_path}")
+            print(f"   Meta:  {result.metadata_path}")
+            print(f"   Info:  {result.attribution}")
         return 0
 
     except httpx.HTTPStatusError as e:
         body = ""
         try:
-            body = e.response.text
+            body = (e.response.content[:ERROR_BODY_PREVIEW] or b"").decode("utf-8", errors="replace")
         except Exception:
             body = ""
         raise SystemExit(f"Pexels API error: HTTP {e.response.status_code}\n{body}")
@@ -4,36 +4,74 @@ AI Content CLI.
 Command-line interface for the AI content generation package.
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.logging import RichHandler
 
-# Import providers to register them
-from ai_content import providers  # noqa: F401
-from ai_content.core import ProviderRegistry, GenerationResult
-from ai_content.config import configure, get_settings
 from ai_content.presets import (
+    MUSIC_PRESETS,
+    VIDEO_PRESETS,
     get_music_preset,
     get_video_preset,
-    list_music_presets,
-    list_video_presets,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ai_content.core import GenerationResult
+    from ai_content.core.job_tracker import Job
+
+# Providers (and their HTTP/SDK dependencies) and the pydantic settings are
+# imported inside the commands that use them, so `--help`, `list-presets` and
+# the job commands start fast.
+
+# Generation states reported by the AIMLAPI status endpoint (lowercased)
+_COMPLETE_STATES = frozenset({"completed", "done", "success"})
+_PENDING_STATES = frozenset({"queued", "pending", "processing"})
+_FAILED_STATES = frozenset({"failed", "error"})
+
+# Rich color per job status (JobStatus is a str enum, so plain values work as keys).
+_STATUS_STYLE = {
+    "queued": "yellow",
+    "processing": "yellow",
+    "completed": "green",
+    "downloaded": "green",
+    "failed": "red",
+}
+
+# Max concurrent AIMLAPI requests during `jobs-sync`, to stay inside rate limits.
+_SYNC_CONCURRENCY = 8
+
 app = typer.Typer(
     name="ai-content",
     help="AI Content Generation CLI",
     no_args_is_help=True,
 )
-console = Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Get the shared rich console."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _trunc(text: str, width: int) -> str:
+    """Shorten text to at most `width` characters, marking the cut with '...'."""
+    return text if len(text) <= width else text[: width - 3] + "..."
 
 
 def setup_logging(verbose: bool = False):
     """Configure logging with rich output."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -51,6 +89,8 @@ def main(
     """AI Content Generation CLI."""
     setup_logging(verbose)
     if config:
+        from ai_content.config import configure
+
         configure(config_path=config)
 
 
@@ -108,9 +148,13 @@ async def _generate_music(
     force: bool = False,
 ):
     """Async music generation with job tracking."""
+    from ai_content import providers  # noqa: F401  (registers providers)
+    from ai_content.core import ProviderRegistry
     from ai_content.core.job_tracker import get_tracker, JobStatus
+    from ai_content.providers.aimlapi.client import close_shared_client
     import shlex
 
+    console = _console()
     tracker = get_tracker()
 
     # Apply preset if specified
@@ -124,40 +168,55 @@ async def _generate_music(
             console.print(f"[red]{e}[/red]")
             raise typer.Exit(1)
 
+    # Get provider
+    try:
+        music_provider = ProviderRegistry.get_music(provider)
+    except KeyError:
+        available = ProviderRegistry.list_music_providers()
+        console.print(f"[red]Unknown provider: {provider}. Available: {available}[/red]")
+        raise typer.Exit(1)
+
+    # Warm the provider's client while the lyrics and duplicate checks run
+    prewarm = getattr(music_provider, "prewarm", None)
+    prewarm_task = asyncio.create_task(prewarm()) if prewarm else None
+
     # Read lyrics if provided
     lyrics = None
+    lyrics_sig = None
     if lyrics_file:
         if not lyrics_file.exists():
             console.print(f"[red]Lyrics file not found: {lyrics_file}[/red]")
             raise typer.Exit(1)
+
+        # Cheap probe first: an unchanged lyrics file (same path, mtime and size)
+        # already used for this prompt is a duplicate without reading it.
+        stat = lyrics_file.stat()
+        lyrics_sig = f"{lyrics_file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        if not force:
+            _exit_if_duplicate(
+                tracker.find_duplicate_by_lyrics_file(
+                    prompt=prompt,
+                    provider=provider,
+                    content_type="music",
+                    lyrics_sig=lyrics_sig,
+                    reference_url=reference_url,
+                )
+            )
+
         lyrics = lyrics_file.read_text()
         console.print(f"[green]Loaded lyrics: {len(lyrics)} characters[/green]")
 
     # Check for duplicates (unless --force)
     if not force:
-        existing = tracker.find_duplicate(
-            prompt=prompt,
-            provider=provider,
-            content_type="music",
-            lyrics=lyrics,
-            reference_url=reference_url,
+        _exit_if_duplicate(
+            tracker.find_duplicate(
+                prompt=prompt,
+                provider=provider,
+                content_type="music",
+                lyrics=lyrics,
+                reference_url=reference_url,
+            )
         )
-        if existing:
-            if existing.status == JobStatus.COMPLETED or existing.status == JobStatus.DOWNLOADED:
-                console.print(f"[yellow]⚠️ Duplicate found (already completed)[/yellow]")
-                console.print(f"   Job ID: {existing.id}")
-                if existing.output_path:
-                    console.print(f"   Output: {existing.output_path}")
-                console.print("[cyan]Use --force to generate anyway[/cyan]")
-                raise typer.Exit(0)
-            elif existing.status in (JobStatus.QUEUED, JobStatus.PROCESSING):
-                console.print(f"[yellow]⚠️ Duplicate found (still processing)[/yellow]")
-                console.print(f"   Job ID: {existing.id}")
-                console.print(f"   Status: {existing.status.value}")
-                console.print(
-                    f"[cyan]Check status: uv run ai-content music-status {existing.id}[/cyan]"
-                )
-                raise typer.Exit(0)
 
     # Handle reference URL for style transfer
     if reference_url:
@@ -165,50 +224,49 @@ async def _generate_music(
         if provider != "minimax":
             console.print("[yellow]Note: Reference audio is only supported by MiniMax[/yellow]")
 
-    # Get provider
-    try:
-        music_provider = ProviderRegistry.get_music(provider)
-    except KeyError:
-        available = ProviderRegistry.list_music_providers()
-        console.print(f"[red]Unknown provider: {provider}. Available: {available}[/red]")
-        raise typer.Exit(1)
-
     console.print(f"[blue]Generating with {provider}...[/blue]")
 
-    # Build command string for tracking
-    cmd_parts = ["ai-content", "music", "--prompt", shlex.quote(prompt), "--provider", provider]
-    if lyrics_file:
-        cmd_parts.extend(["--lyrics", str(lyrics_file)])
-    if reference_url:
-        cmd_parts.extend(["--reference-url", reference_url])
-    if output:
-        cmd_parts.extend(["--output", str(output)])
-    if temperature != 1.0:
-        cmd_parts.extend(["--temperature", str(temperature)])
-    command_str = " ".join(cmd_parts)
+    if prewarm_task:
+        await prewarm_task
 
     # Generate
-    result = await music_provider.generate(
-        prompt=prompt,
-        bpm=bpm,
-        duration_seconds=duration,
-        lyrics=lyrics,
-        reference_audio_url=reference_url,
-        output_path=str(output) if output else None,
-        temperature=temperature,
-    )
+    try:
+        result = await music_provider.generate(
+            prompt=prompt,
+            bpm=bpm,
+            duration_seconds=duration,
+            lyrics=lyrics,
+            reference_audio_url=reference_url,
+            output_path=str(output) if output else None,
+            temperature=temperature,
+        )
+    finally:
+        # This command runs the event loop, so it owns the loop's shared AIMLAPI client
+        await close_shared_client()
 
     # Track job if we got a generation ID
     if result.generation_id:
+        # Build command string for tracking (only needed once there is a job to record)
+        cmd_parts = ["ai-content", "music", "--prompt", prompt, "--provider", provider]
+        if lyrics_file:
+            cmd_parts.extend(["--lyrics", str(lyrics_file)])
+        if reference_url:
+            cmd_parts.extend(["--reference-url", reference_url])
+        if output:
+            cmd_parts.extend(["--output", str(output)])
+        if temperature != 1.0:
+            cmd_parts.extend(["--temperature", str(temperature)])
+
         tracker.create_job(
             generation_id=result.generation_id,
             provider=provider,
             content_type="music",
             prompt=prompt,
-            command=command_str,
+            command=shlex.join(cmd_parts),
             lyrics=lyrics,
             reference_url=reference_url,
             metadata={"bpm": bpm, "duration": duration},
+            lyrics_sig=lyrics_sig,
         )
         console.print(f"[dim]Job tracked: {result.generation_id}[/dim]")
 
@@ -227,6 +285,31 @@ async def _generate_music(
     _print_result(result)
 
 
+def _exit_if_duplicate(existing: Job | None):
+    """Report a duplicate job and exit, unless it failed or there is none."""
+    from ai_content.core.job_tracker import JobStatus
+
+    if not existing:
+        return
+
+    console = _console()
+    if existing.status == JobStatus.COMPLETED or existing.status == JobStatus.DOWNLOADED:
+        console.print(f"[yellow]⚠️ Duplicate found (already completed)[/yellow]")
+        console.print(f"   Job ID: {existing.id}")
+        if existing.output_path:
+            console.print(f"   Output: {existing.output_path}")
+        console.print("[cyan]Use --force to generate anyway[/cyan]")
+        raise typer.Exit(0)
+    elif existing.status in (JobStatus.QUEUED, JobStatus.PROCESSING):
+        console.print(f"[yellow]⚠️ Duplicate found (still processing)[/yellow]")
+        console.print(f"   Job ID: {existing.id}")
+        console.print(f"   Status: {existing.status.value}")
+        console.print(
+            f"[cyan]Check status: uv run ai-content music-status {existing.id}[/cyan]"
+        )
+        raise typer.Exit(0)
+
+
 # === Video Commands ===
 
 
@@ -264,6 +347,11 @@ async def _generate_video(
     output: Optional[Path],
 ):
     """Async video generation."""
+    from ai_content import providers  # noqa: F401  (registers providers)
+    from ai_content.core import ProviderRegistry
+
+    console = _console()
+
     # Apply preset if specified
     if style:
         try:
@@ -308,6 +396,10 @@ async def _generate_video(
 @app.command()
 def list_providers():
     """List all available providers."""
+    from ai_content import providers  # noqa: F401  (registers providers)
+    from ai_content.core import ProviderRegistry
+
+    console = _console()
     console.print("\n[bold]Music Providers:[/bold]")
     for name in ProviderRegistry.list_music_providers():
         console.print(f"  • {name}")
@@ -324,19 +416,19 @@ def list_providers():
 @app.command()
 def list_presets():
     """List all available presets."""
+    console = _console()
     console.print("\n[bold]Music Presets:[/bold]")
-    for name in list_music_presets():
-        preset = get_music_preset(name)
+    for name, preset in MUSIC_PRESETS.items():
         console.print(f"  • {name}: {preset.mood} ({preset.bpm} BPM)")
 
     console.print("\n[bold]Video Presets:[/bold]")
-    for name in list_video_presets():
-        preset = get_video_preset(name)
+    for name, preset in VIDEO_PRESETS.items():
         console.print(f"  • {name}: {preset.aspect_ratio}")
 
 
 def _print_result(result: GenerationResult):
     """Print generation result."""
+    console = _console()
     if result.success:
         console.print(f"\n[bold green]✅ Success![/bold green]")
         console.print(f"   Provider: {result.provider}")
@@ -364,45 +456,32 @@ def music_status(
 
 async def _check_music_status(generation_id: str, output: Optional[Path]):
     """Check generation status and download if ready."""
-    from ai_content.providers.aimlapi.client import AIMLAPIClient
+    from ai_content.providers.aimlapi.client import close_shared_client, get_shared_client
+    from ai_content.providers.aimlapi._url_extract import extract_audio_url
     from ai_content.core.job_tracker import get_tracker, JobStatus
 
-    client = AIMLAPIClient()
+    console = _console()
+    client = get_shared_client()
     tracker = get_tracker()
     console.print(f"[cyan]Checking status for: {generation_id}[/cyan]")
 
     try:
         status = await client.poll_status("/v2/generate/audio", generation_id)
-        state = status.get("status") or status.get("state", "unknown")
+        state = status.get("status") or status.get("state") or "unknown"
         console.print(f"[blue]Status: {state}[/blue]")
+        state_l = state.lower()
 
-        if state.lower() in ("completed", "done", "success"):
+        if state_l in _COMPLETE_STATES:
             console.print("[green]✅ Generation complete![/green]")
 
-            # Extract audio URL
-            audio_url = None
-            for key in ["audio_url", "url", "output"]:
-                if key in status:
-                    val = status[key]
-                    if isinstance(val, str) and val.startswith("http"):
-                        audio_url = val
-                        break
-                    elif isinstance(val, dict):
-                        audio_url = val.get("audio_url") or val.get("url")
-                        if audio_url:
-                            break
-                    elif isinstance(val, list) and val:
-                        audio_url = val[0].get("audio_url") or val[0].get("url")
-                        if audio_url:
-                            break
+            audio_url = extract_audio_url(status)
 
             if audio_url and output:
                 console.print(f"[blue]Downloading to {output}...[/blue]")
-                audio_data = await client.download_file(audio_url)
                 output.parent.mkdir(parents=True, exist_ok=True)
-                output.write_bytes(audio_data)
+                await client.stream_to_file(audio_url, output)
                 console.print(f"[green]✅ Saved to {output}[/green]")
-                console.print(f"   Size: {len(audio_data) / (1024 * 1024):.2f} MB")
+                console.print(f"   Size: {output.stat().st_size / (1024 * 1024):.2f} MB")
                 # Update job tracker
                 tracker.update_status(generation_id, JobStatus.DOWNLOADED, str(output))
             elif audio_url:
@@ -414,12 +493,12 @@ async def _check_music_status(generation_id: str, output: Optional[Path]):
                 console.print(f"Response: {status}")
                 tracker.update_status(generation_id, JobStatus.COMPLETED)
 
-        elif state.lower() in ("queued", "pending", "processing"):
+        elif state_l in _PENDING_STATES:
             console.print("[yellow]Still processing. Check again later.[/yellow]")
             console.print(f"Run: uv run ai-content music-status {generation_id}")
-            if state.lower() == "processing":
+            if state_l == "processing":
                 tracker.update_status(generation_id, JobStatus.PROCESSING)
-        elif state.lower() in ("failed", "error"):
+        elif state_l in _FAILED_STATES:
             error = status.get("error") or status.get("message") or "Unknown error"
             console.print(f"[red]❌ Generation failed: {error}[/red]")
             tracker.update_status(generation_id, JobStatus.FAILED)
@@ -430,7 +509,8 @@ async def _check_music_status(generation_id: str, output: Optional[Path]):
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
     finally:
-        await client.close()
+        # This command runs the event loop, so it owns the loop's shared AIMLAPI client
+        await close_shared_client()
 
 
 # === Job Management Commands ===
@@ -451,6 +531,7 @@ def jobs(
     from ai_content.core.job_tracker import get_tracker, JobStatus
     from rich.table import Table
 
+    console = _console()
     tracker = get_tracker()
 
     # Parse status filter
@@ -479,23 +560,14 @@ def jobs(
 
     for job in job_list:
         # Color-code status
-        status_str = job.status.value
-        if job.status == JobStatus.COMPLETED or job.status == JobStatus.DOWNLOADED:
-            status_str = f"[green]{status_str}[/green]"
-        elif job.status == JobStatus.FAILED:
-            status_str = f"[red]{status_str}[/red]"
-        elif job.status in (JobStatus.QUEUED, JobStatus.PROCESSING):
-            status_str = f"[yellow]{status_str}[/yellow]"
-
+        style = _STATUS_STYLE[job.status]
         table.add_row(
-            job.id[:18] + "..." if len(job.id) > 20 else job.id,
+            _trunc(job.id, 20),
             job.provider,
             job.content_type,
-            status_str,
+            f"[{style}]{job.status.value}[/{style}]",
             job.created_at.strftime("%m-%d %H:%M"),
-            (job.output_path[:28] + "...")
-            if job.output_path and len(job.output_path) > 30
-            else (job.output_path or "-"),
+            _trunc(job.output_path, 30) if job.output_path else "-",
         )
 
     console.print(table)
@@ -507,42 +579,30 @@ def jobs_stats():
     from ai_content.core.job_tracker import get_tracker
     from rich.panel import Panel
 
+    console = _console()
     tracker = get_tracker()
     stats = tracker.get_stats()
 
     # Build stats display
+    by_provider = stats["by_provider"]
+    by_type = stats["by_type"]
     lines = [
         f"[bold]Total Jobs:[/bold] {stats['total']}",
         "",
         "[bold]By Status:[/bold]",
+        *(
+            f"  [{_STATUS_STYLE[status]}]{status}:[/{_STATUS_STYLE[status]}] {count}"
+            for status, count in stats["by_status"].items()
+            if count > 0
+        ),
+        *(("", "[bold]By Provider:[/bold]") if by_provider else ()),
+        *(f"  [blue]{provider}:[/blue] {count}" for provider, count in by_provider.items()),
+        *(("", "[bold]By Type:[/bold]") if by_type else ()),
+        *(f"  [cyan]{content_type}:[/cyan] {count}" for content_type, count in by_type.items()),
+        "",
+        f"[dim]Recent (24h): {stats['recent_24h']}[/dim]",
     ]
 
-    for status, count in stats["by_status"].items():
-        if count > 0:
-            color = (
-                "green"
-                if status in ("completed", "downloaded")
-                else "yellow"
-                if status in ("queued", "processing")
-                else "red"
-            )
-            lines.append(f"  [{color}]{status}:[/{color}] {count}")
-
-    if stats["by_provider"]:
-        lines.append("")
-        lines.append("[bold]By Provider:[/bold]")
-        for provider, count in stats["by_provider"].items():
-            lines.append(f"  [blue]{provider}:[/blue] {count}")
-
-    if stats["by_type"]:
-        lines.append("")
-        lines.append("[bold]By Type:[/bold]")
-        for content_type, count in stats["by_type"].items():
-            lines.append(f"  [cyan]{content_type}:[/cyan] {count}")
-
-    lines.append("")
-    lines.append(f"[dim]Recent (24h): {stats['recent_24h']}[/dim]")
-
     console.print(Panel("\n".join(lines), title="📊 Job Statistics", border_style="blue"))
 
 
@@ -558,10 +618,12 @@ def jobs_sync(
 async def _sync_jobs(job_id: str | None, download: bool):
     """Sync pending jobs with API status."""
     from ai_content.core.job_tracker import get_tracker, JobStatus
-    from ai_content.providers.aimlapi.client import AIMLAPIClient
+    from ai_content.providers.aimlapi.client import close_shared_client, get_shared_client
+    from ai_content.providers.aimlapi._url_extract import extract_audio_url
 
+    console = _console()
     tracker = get_tracker()
-    client = AIMLAPIClient()
+    client = get_shared_client()
 
     if job_id:
         # Sync specific job
@@ -580,48 +642,76 @@ async def _sync_jobs(job_id: str | None, download: bool):
 
     console.print(f"[blue]Syncing {len(jobs_to_sync)} job(s)...[/blue]")
 
+    # Only sync MiniMax jobs (other providers may have different APIs)
+    minimax_jobs = []
     for job in jobs_to_sync:
-        try:
-            # Only sync MiniMax jobs (other providers may have different APIs)
-            if job.provider != "minimax":
-                console.print(f"[dim]Skipping {job.id} (provider: {job.provider})[/dim]")
+        if job.provider != "minimax":
+            console.print(f"[dim]Skipping {job.id} (provider: {job.provider})[/dim]")
+            continue
+        minimax_jobs.append(job)
+
+    semaphore = asyncio.Semaphore(_SYNC_CONCURRENCY)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    try:
+        # Poll every job concurrently instead of paying one round-trip per job in turn
+        statuses = await asyncio.gather(
+            *(bounded(client.poll_status("/v2/generate/audio", job.id)) for job in minimax_jobs),
+            return_exceptions=True,
+        )
+
+        pending_downloads = []
+        for job, status in zip(minimax_jobs, statuses, strict=True):
+            if isinstance(status, BaseException):
+                console.print(f"   [red]Error syncing {job.id}: {status}[/red]")
                 continue
 
-            status = await client.poll_status("/v2/generate/audio", job.id)
-            state = status.get("status") or status.get("state", "unknown")
-
-            console.print(f"[cyan]{job.id[:15]}...:[/cyan] {state}")
-
-            if state.lower() in ("completed", "done", "success"):
-                # Extract audio URL if available
-                audio_url = None
-                for key in ["audio_url", "url", "output"]:
-                    if key in status:
-                        val = status[key]
-                        if isinstance(val, str) and val.startswith("http"):
-                            audio_url = val
-                            break
-
-                if audio_url and download:
-                    # Download the file
-                    output_path = Path(f"output/{job.content_type}/job_{job.id[:8]}.mp3")
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    audio_data = await client.download_file(audio_url)
-                    output_path.write_bytes(audio_data)
-                    tracker.update_status(job.id, JobStatus.DOWNLOADED, str(output_path))
-                    console.print(f"   [green]Downloaded to {output_path}[/green]")
-                else:
-                    tracker.update_status(job.id, JobStatus.COMPLETED)
-
-            elif state.lower() in ("failed", "error"):
-                tracker.update_status(job.id, JobStatus.FAILED)
-            elif state.lower() in ("processing",):
-                tracker.update_status(job.id, JobStatus.PROCESSING)
-
-        except Exception as e:
-            console.print(f"   [red]Error syncing {job.id}: {e}[/red]")
-
-    await client.close()
+            # One malformed status or tracker error must not stop the other jobs
+            try:
+                state = status.get("status") or status.get("state") or "unknown"
+                console.print(f"[cyan]{job.id[:15]}...:[/cyan] {state}")
+                state_l = state.lower()
+
+                if state_l in _COMPLETE_STATES:
+                    audio_url = extract_audio_url(status)
+
+                    if audio_url and download:
+                        output_path = Path(f"output/{job.content_type}/job_{job.id[:8]}.mp3")
+                        pending_downloads.append((job, audio_url, output_path))
+                    else:
+                        tracker.update_status(job.id, JobStatus.COMPLETED)
+
+                elif state_l in _FAILED_STATES:
+                    tracker.update_status(job.id, JobStatus.FAILED)
+                elif state_l == "processing":
+                    tracker.update_status(job.id, JobStatus.PROCESSING)
+            except Exception as e:
+                console.print(f"   [red]Error syncing {job.id}: {e}[/red]")
+
+        # Download completed jobs concurrently (jobs share a few output dirs; create each once)
+        for output_dir in {path.parent for _, _, path in pending_downloads}:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        results = await asyncio.gather(
+            *(bounded(client.stream_to_file(url, path)) for _, url, path in pending_downloads),
+            return_exceptions=True,
+        )
+        for (job, _, output_path), result in zip(pending_downloads, results, strict=True):
+            if isinstance(result, BaseException):
+                console.print(f"   [red]Error downloading {job.id}: {result}[/red]")
+                continue
+            try:
+                tracker.update_status(job.id, JobStatus.DOWNLOADED, str(output_path))
+            except Exception as e:
+                console.print(f"   [red]Error syncing {job.id}: {e}[/red]")
+                continue
+            console.print(f"   [green]Downloaded {job.id[:15]}... to {output_path}[/green]")
+    finally:
+        # This command runs the event loop, so it owns the loop's shared AIMLAPI client
+        await close_shared_client()
+
     console.print("[green]Sync complete[/green]")
 
 
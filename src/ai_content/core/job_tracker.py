@@ -96,7 +96,14 @@ class JobTracker:
         metadata TEXT
     );
 
-    CREATE INDEX IF NOT EXISTS idx_prompt_hash ON jobs(prompt_hash);
+    -- Serves find_duplicate's hash lookup and its newest-first ordering without a sort
+    CREATE INDEX IF NOT EXISTS idx_prompt_hash_created ON jobs(prompt_hash, created_at);
+    -- Superseded by idx_prompt_hash_created; drop it from older databases
+    DROP INDEX IF EXISTS idx_prompt_hash;
+    -- Serves find_duplicate_by_lyrics_file the same way, keyed on the fingerprint
+    -- create_job stores in metadata (an expression index needs no table migration)
+    CREATE INDEX IF NOT EXISTS idx_lyrics_file_hash
+        ON jobs(json_extract(metadata, '$.lyrics_file_hash'), created_at);
     CREATE INDEX IF NOT EXISTS idx_status ON jobs(status);
     CREATE INDEX IF NOT EXISTS idx_provider ON jobs(provider);
     CREATE INDEX IF NOT EXISTS idx_created_at ON jobs(created_at);
@@ -163,6 +170,7 @@ class JobTracker:
         lyrics: str | None = None,
         reference_url: str | None = None,
         metadata: dict[str, Any] | None = None,
+        lyrics_sig: str | None = None,
     ) -> Job:
         """
         Create a new job record.
@@ -176,6 +184,8 @@ class JobTracker:
             lyrics: Optional lyrics content
             reference_url: Optional reference audio URL
             metadata: Additional metadata (bpm, duration, etc.)
+            lyrics_sig: Lyrics file signature (path, mtime, size), recorded
+                so find_duplicate_by_lyrics_file can match later runs
 
         Returns:
             The created Job object
@@ -191,6 +201,11 @@ class JobTracker:
             metadata["lyrics_length"] = len(lyrics)
         if reference_url:
             metadata["reference_url"] = reference_url
+        if lyrics_sig:
+            metadata["lyrics_sig"] = lyrics_sig
+            metadata["lyrics_file_hash"] = self.hash_prompt(
+                prompt, provider, content_type, lyrics_sig, reference_url
+            )
 
         with self._get_connection() as conn:
             conn.execute(
@@ -261,6 +276,37 @@ class JobTracker:
             ).fetchone()
             return Job.from_row(row) if row else None
 
+    def find_duplicate_by_lyrics_file(
+        self,
+        prompt: str,
+        provider: str,
+        content_type: str,
+        lyrics_sig: str,
+        reference_url: str | None = None,
+    ) -> Job | None:
+        """
+        Find an existing job made from the same, unchanged lyrics file.
+
+        `lyrics_sig` identifies the file by path, mtime and size (recorded
+        by create_job), so callers can detect a re-run without reading the
+        lyrics. Returns the most recent non-failed match, or None.
+        """
+        lyrics_file_hash = self.hash_prompt(
+            prompt, provider, content_type, lyrics_sig, reference_url
+        )
+
+        with self._get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT * FROM jobs
+                WHERE json_extract(metadata, '$.lyrics_file_hash') = ? AND status != ?
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                (lyrics_file_hash, JobStatus.FAILED.value),
+            ).fetchone()
+            return Job.from_row(row) if row else None
+
     def update_status(
         self,
         job_id: str,
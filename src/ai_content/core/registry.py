@@ -56,7 +56,7 @@ class ProviderRegistry:
 
         def decorator(provider_cls: Type[MusicProvider]) -> Type[MusicProvider]:
             cls._music_providers[name] = provider_cls
-            logger.debug(f"Registered music provider: {name}")
+            logger.debug("Registered music provider: %s", name)
             return provider_cls
 
         return decorator
@@ -67,7 +67,7 @@ class ProviderRegistry:
 
         def decorator(provider_cls: Type[VideoProvider]) -> Type[VideoProvider]:
             cls._video_providers[name] = provider_cls
-            logger.debug(f"Registered video provider: {name}")
+            logger.debug("Registered video provider: %s", name)
             return provider_cls
 
         return decorator
@@ -78,7 +78,7 @@ class ProviderRegistry:
 
         def decorator(provider_cls: Type[ImageProvider]) -> Type[ImageProvider]:
             cls._image_providers[name] = provider_cls
-            logger.debug(f"Registered image provider: {name}")
+            logger.debug("Registered image provider: %s", name)
             return provider_cls
 
         return decorator
@@ -21,6 +21,8 @@ class GenerationResult:
         content_type: Type of content ("music", "video", "image")
         file_path: Path to saved file (if saved)
         data: Raw bytes of generated content (if not saved)
+        file_paths: All saved files when one request produced several
+        data_list: Raw bytes for each entry in file_paths
         duration_seconds: Duration of audio/video content
         metadata: Provider-specific metadata
         error: Error message if generation failed
@@ -41,6 +43,8 @@ class GenerationResult:
 
     file_path: Path | None = None
     data: bytes | None = None
+    file_paths: list[Path] = field(default_factory=list)
+    data_list: list[bytes] = field(default_factory=list)
     duration_seconds: float | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
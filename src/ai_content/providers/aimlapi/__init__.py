@@ -1,9 +1,15 @@
 """AIMLAPI providers module."""
 
-from ai_content.providers.aimlapi.client import AIMLAPIClient
+from ai_content.providers.aimlapi.client import (
+    AIMLAPIClient,
+    close_shared_client,
+    get_shared_client,
+)
 from ai_content.providers.aimlapi.minimax import MiniMaxMusicProvider
 
 __all__ = [
     "AIMLAPIClient",
+    "close_shared_client",
+    "get_shared_client",
     "MiniMaxMusicProvider",
 ]
@@ -0,0 +1,56 @@
+"""
+Audio URL extraction for AIMLAPI status responses.
+
+AIMLAPI has returned the finished audio under several keys and shapes over
+time; this module resolves them with one table so the provider and the CLI
+agree on where to look.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+
+def _from_str(value: str) -> str | None:
+    return value if value.startswith("http") else None
+
+
+def _from_mapping(value: dict[str, Any]) -> str | None:
+    return value.get("audio_url") or value.get("url")
+
+
+def _from_list(value: list[Any]) -> str | None:
+    return _extract_value(value[0]) if value else None
+
+
+_EXTRACTORS: dict[type, Callable[[Any], str | None]] = {
+    str: _from_str,
+    dict: _from_mapping,
+    list: _from_list,
+}
+
+# Keys that may hold the audio URL, in priority order (music-2.0 uses "audio_file").
+AUDIO_URL_KEYS = ("audio_file", "audio_url", "url", "output", "result")
+
+
+def _extract_value(value: Any) -> str | None:
+    extractor = _EXTRACTORS.get(type(value))
+    return extractor(value) if extractor else None
+
+
+def extract_audio_url(status: dict[str, Any]) -> str | None:
+    """
+    Extract the audio URL from a status response.
+
+    Args:
+        status: Status payload from `AIMLAPIClient.poll_status`
+
+    Returns:
+        The first URL found under `AUDIO_URL_KEYS`, or None
+    """
+    for key in AUDIO_URL_KEYS:
+        value = status.get(key)
+        if value is not None:
+            url = _extract_value(value)
+            if url:
+                return url
+    return None
@@ -6,10 +6,17 @@ Shared HTTP client for all AIMLAPI-based providers.
 
 import asyncio
 import logging
+import random
+from pathlib import Path
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: pip install "ai-content[speedups]"
+    orjson = None
+
 from ai_content.core.exceptions import (
     ProviderError,
     RateLimitError,
@@ -22,6 +29,13 @@ logger = logging.getLogger(__name__)
 APPLICATION_JSON = "application/json"
 
 
+def _parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class AIMLAPIClient:
     """
     Base HTTP client for AIMLAPI.
@@ -43,6 +57,7 @@ class AIMLAPIClient:
     def __init__(self):
         self.settings = get_settings().aimlapi
         self._http_client: httpx.AsyncClient | None = None
+        self._download_client: httpx.AsyncClient | None = None
 
     @property
     def headers(self) -> dict[str, str]:
@@ -64,11 +79,20 @@ class AIMLAPIClient:
             )
         return self._http_client
 
+    async def _get_download_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client for result downloads (no API base URL or auth)."""
+        if self._download_client is None or self._download_client.is_closed:
+            self._download_client = httpx.AsyncClient(timeout=120.0)
+        return self._download_client
+
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._http_client and not self._http_client.is_closed:
             await self._http_client.aclose()
             self._http_client = None
+        if self._download_client and not self._download_client.is_closed:
+            await self._download_client.aclose()
+            self._download_client = None
 
     async def submit_generation(
         self,
@@ -90,7 +114,7 @@ class AIMLAPIClient:
         try:
             response = await client.post(endpoint, json=payload)
             self._handle_error(response)
-            return response.json()
+            return _parse_json(response)
         except httpx.HTTPStatusError as e:
             self._handle_error(e.response)
             raise
@@ -117,28 +141,51 @@ class AIMLAPIClient:
             params={"generation_id": generation_id},
         )
         self._handle_error(response)
-        return response.json()
+        return _parse_json(response)
 
     async def wait_for_completion(
         self,
         endpoint: str,
         generation_id: str,
         check_complete: callable = None,
+        *,
+        initial_delay: float = 1.0,
+        max_delay: float | None = None,
+        backoff: float = 1.5,
+        jitter: float = 0.2,
     ) -> dict[str, Any]:
         """
         Poll until generation is complete.
 
+        Polls start quickly and back off exponentially (with jitter) up to
+        `max_delay`, so short jobs finish promptly while long ones are not
+        polled needlessly. The overall time budget is
+        `max_poll_attempts * poll_interval` from settings.
+
         Args:
             endpoint: API endpoint for status checks
             generation_id: ID from submit_generation
             check_complete: Optional function to check if complete
+            initial_delay: Seconds to wait after the first poll
+            max_delay: Cap on the delay between polls (default: settings.poll_interval)
+            backoff: Multiplier applied to the delay after each poll
+            jitter: Random +/- fraction applied to each delay
 
         Returns:
             Final status response
         """
         logger.info(f"   Polling for completion (ID: {generation_id[:8]}...)")
 
-        for attempt in range(self.settings.max_poll_attempts):
+        if max_delay is None:
+            max_delay = float(self.settings.poll_interval)
+        budget = self.settings.max_poll_attempts * self.settings.poll_interval
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        delay = initial_delay
+        attempt = 0
+
+        while True:
+            attempt += 1
             status = await self.poll_status(endpoint, generation_id)
 
             # Default completion check
@@ -158,23 +205,59 @@ class AIMLAPIClient:
                     raise ProviderError("aimlapi", error)
 
             if is_complete:
-                logger.info(f"   Completed after {attempt + 1} polls")
+                logger.info(f"   Completed after {attempt} polls")
                 return status
 
-            logger.debug(f"   Poll {attempt + 1}/{self.settings.max_poll_attempts}")
-            await asyncio.sleep(self.settings.poll_interval)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            sleep_for = min(delay * (1 + random.uniform(-jitter, jitter)), remaining)
+            logger.debug(f"   Poll {attempt}, next in {sleep_for:.1f}s")
+            await asyncio.sleep(sleep_for)
+            delay = min(max_delay, delay * backoff)
 
         raise ProviderError(
             "aimlapi",
-            f"Generation timed out after {self.settings.max_poll_attempts} polls",
+            f"Generation timed out after {attempt} polls ({budget}s)",
         )
 
     async def download_file(self, url: str) -> bytes:
         """Download file from URL."""
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(url)
+        client = await self._get_download_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+
+    async def stream_to_file(self, url: str, path: Path, chunk_size: int = 1 << 16) -> Path:
+        """
+        Stream a file from URL straight to disk.
+
+        Unlike `download_file`, the body is never held in memory as a whole,
+        and all file I/O (open, writes, close) runs off the event loop.
+
+        Args:
+            url: Source URL
+            path: Destination file (its directory must exist); removed if
+                the download fails part-way
+            chunk_size: Download chunk size
+
+        Returns:
+            Path to the written file
+        """
+        client = await self._get_download_client()
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
-            return response.content
+            f = await asyncio.to_thread(path.open, "wb")
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await asyncio.to_thread(f.write, chunk)
+            except BaseException:
+                f.close()
+                path.unlink(missing_ok=True)
+                raise
+            await asyncio.to_thread(f.close)
+        return path
 
     def _handle_error(self, response: httpx.Response):
         """Handle HTTP errors."""
@@ -194,3 +277,44 @@ class AIMLAPIClient:
             except Exception:
                 message = response.text[:200]
             raise ProviderError("aimlapi", message)
+
+
+_shared_clients: dict[asyncio.AbstractEventLoop | None, AIMLAPIClient] = {}
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_shared_client(loop: asyncio.AbstractEventLoop | None = None) -> AIMLAPIClient:
+    """
+    Get the shared AIMLAPI client for an event loop.
+
+    Providers and CLI commands share one client per loop so its HTTP
+    connection pools stay warm across calls. httpx pools are bound to the
+    loop they were opened on, so each loop (e.g. each `asyncio.run`) gets
+    its own client; whoever runs the loop closes it with
+    `close_shared_client()` before the loop ends.
+
+    Args:
+        loop: Event loop the client will be used on (default: the running loop)
+    """
+    if loop is None:
+        loop = _running_loop()
+    client = _shared_clients.get(loop)
+    if client is None:
+        # Forget clients whose loop has finished; their pools are unusable
+        for stale in [k for k in _shared_clients if k is not None and k.is_closed()]:
+            del _shared_clients[stale]
+        client = _shared_clients[loop] = AIMLAPIClient()
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close and forget the running loop's shared client, if one was created."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
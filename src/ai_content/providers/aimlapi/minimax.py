@@ -4,13 +4,15 @@ MiniMax Music provider via AIMLAPI.
 Supports reference audio and lyrics.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
 from ai_content.core.registry import ProviderRegistry
 from ai_content.core.result import GenerationResult
-from ai_content.providers.aimlapi.client import AIMLAPIClient
+from ai_content.providers.aimlapi.client import AIMLAPIClient, get_shared_client
+from ai_content.providers.aimlapi._url_extract import extract_audio_url
 from ai_content.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -41,8 +43,13 @@ class MiniMaxMusicProvider:
     supports_reference_audio = True
 
     def __init__(self):
-        self.settings = get_settings().aimlapi
-        self.client = AIMLAPIClient()
+        self._settings = get_settings()
+        self.settings = self._settings.aimlapi
+
+    @property
+    def client(self) -> AIMLAPIClient:
+        """Shared AIMLAPI client for the running event loop."""
+        return get_shared_client()
 
     async def generate(
         self,
@@ -115,19 +122,16 @@ class MiniMaxMusicProvider:
                     generation_id=generation_id,
                 )
 
-            # Download audio
-            audio_data = await self.client.download_file(audio_url)
-
             # Save
             if output_path:
                 file_path = Path(output_path)
             else:
-                output_dir = get_settings().output_dir
+                output_dir = self._settings.output_dir
                 timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
                 file_path = output_dir / f"minimax_{timestamp}.mp3"
 
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(audio_data)
+            await asyncio.to_thread(file_path.parent.mkdir, parents=True, exist_ok=True)
+            await self.client.stream_to_file(audio_url, file_path)
 
             logger.info(f"✅ MiniMax: Saved to {file_path}")
 
@@ -136,7 +140,6 @@ class MiniMaxMusicProvider:
                 provider=self.name,
                 content_type="music",
                 file_path=file_path,
-                data=audio_data,
                 generation_id=generation_id,
                 metadata={
                     "prompt": prompt,
@@ -164,26 +167,4 @@ class MiniMaxMusicProvider:
 
         AIMLAPI music-2.0 returns: {"audio_file": {"url": "..."}}
         """
-        # music-2.0 format (per docs)
-        if "audio_file" in status:
-            audio_file = status["audio_file"]
-            if isinstance(audio_file, dict):
-                return audio_file.get("url")
-        # Try other common formats
-        if "audio_url" in status:
-            return status["audio_url"]
-        if "url" in status:
-            return status["url"]
-        if "output" in status:
-            output = status["output"]
-            if isinstance(output, str):
-                return output
-            if isinstance(output, dict):
-                return output.get("audio_url") or output.get("url")
-            if isinstance(output, list) and output:
-                return output[0].get("audio_url") or output[0].get("url")
-        if "result" in status:
-            result = status["result"]
-            if isinstance(result, dict):
-                return result.get("audio_url") or result.get("url")
-        return None
+        return extract_audio_url(status)
@@ -0,0 +1,98 @@
+"""
+Shared Google GenAI client.
+
+All Google providers share one `genai.Client` per (API key, API version,
+event loop), so repeated provider construction reuses its connection pool
+and auth state. The client builds its async HTTP pool up front and that
+pool is bound to the loop it runs on, so each loop (e.g. each
+`asyncio.run`) gets its own client.
+
+Also holds the small output helpers the Google providers share.
+"""
+
+import asyncio
+import contextlib
+import threading
+from pathlib import Path
+from typing import Any
+
+_ClientKey = tuple[str, str | None, asyncio.AbstractEventLoop | None]
+
+_clients: dict[_ClientKey, Any] = {}
+_lock = threading.Lock()
+
+# Output directories already created by this process
+_known_dirs: set[Path] = set()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_genai_client(
+    api_key: str,
+    api_version: str | None = None,
+    loop: asyncio.AbstractEventLoop | None = None,
+) -> Any:
+    """
+    Get the shared GenAI client for an API key, version and event loop.
+
+    Args:
+        api_key: Gemini API key
+        api_version: API version override (e.g. "v1alpha" for Lyria RealTime)
+        loop: Event loop the client will be used on (default: the running loop)
+
+    Returns:
+        A cached `google.genai.Client`
+
+    Raises:
+        ImportError: If google-genai is not installed
+    """
+    if loop is None:
+        loop = _running_loop()
+    key = (api_key, api_version, loop)
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                from google import genai
+
+                if api_version:
+                    client = genai.Client(
+                        api_key=api_key,
+                        http_options={"api_version": api_version},
+                    )
+                else:
+                    client = genai.Client(api_key=api_key)
+                # Forget clients whose loop has finished; their pools are unusable
+                for stale in [k for k in _clients if k[2] is not None and k[2].is_closed()]:
+                    del _clients[stale]
+                _clients[key] = client
+    return client
+
+
+async def prewarm_genai_client(api_key: str | None, api_version: str | None = None) -> None:
+    """
+    Build the shared GenAI client in a worker thread.
+
+    Start this as a task during startup so the first generate() call finds
+    the client ready. Missing credentials or SDK are left for the provider
+    to report.
+    """
+    if not api_key:
+        return
+    with contextlib.suppress(ImportError):
+        await asyncio.to_thread(
+            get_genai_client, api_key, api_version, asyncio.get_running_loop()
+        )
+
+
+async def ensure_dir(path: Path) -> None:
+    """Create an output directory once per process, off the event loop."""
+    if path not in _known_dirs:
+        await asyncio.to_thread(path.mkdir, parents=True, exist_ok=True)
+        _known_dirs.add(path)
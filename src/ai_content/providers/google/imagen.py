@@ -4,8 +4,9 @@ Google Imagen image provider.
 Supports Imagen 4 and Gemini experimental image generation.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 from ai_content.core.registry import ProviderRegistry
@@ -15,6 +16,12 @@ from ai_content.core.exceptions import (
     AuthenticationError,
 )
 from ai_content.config import get_settings
+from ai_content.providers.google.client import ensure_dir, get_genai_client
+
+try:
+    from google.genai import types
+except ImportError:
+    types = None  # reported by generate()
 
 logger = logging.getLogger(__name__)
 
@@ -40,25 +47,21 @@ class GoogleImagenProvider:
     name = "imagen"
 
     def __init__(self):
-        self.settings = get_settings().google
-        self._client = None
+        self._settings = get_settings()
+        self.settings = self._settings.google
 
     def _get_client(self):
-        """Lazy-load the Google GenAI client."""
-        if self._client is None:
-            try:
-                from google import genai
-
-                api_key = self.settings.api_key
-                if not api_key:
-                    raise AuthenticationError("imagen")
-                self._client = genai.Client(api_key=api_key)
-            except ImportError:
-                raise ProviderError(
-                    "imagen",
-                    "google-genai package not installed. Run: pip install google-genai",
-                )
-        return self._client
+        """Get the shared Google GenAI client for the running event loop."""
+        api_key = self.settings.api_key
+        if not api_key:
+            raise AuthenticationError("imagen")
+        try:
+            return get_genai_client(api_key)
+        except ImportError:
+            raise ProviderError(
+                "imagen",
+                "google-genai package not installed. Run: pip install google-genai",
+            )
 
     async def generate(
         self,
@@ -76,10 +79,15 @@ class GoogleImagenProvider:
             prompt: Image description
             aspect_ratio: Image aspect ratio
             num_images: Number of images to generate
-            output_path: Where to save the image
+            output_path: Where to save the image. With several images,
+                each gets an index suffix (image_0.png, image_1.png, ...)
             use_gemini: Use Gemini experimental instead of Imagen
         """
-        from google.genai import types
+        if types is None:
+            raise ProviderError(
+                "imagen",
+                "google-genai package not installed. Run: pip install google-genai",
+            )
 
         client = self._get_client()
 
@@ -90,8 +98,8 @@ class GoogleImagenProvider:
         )
 
         logger.info(f"🖼️ Imagen: Generating image ({aspect_ratio})")
-        logger.debug(f"   Prompt: {prompt[:50]}...")
-        logger.debug(f"   Model: {model}")
+        logger.debug("   Prompt: %.50s...", prompt)
+        logger.debug("   Model: %s", model)
 
         try:
             if use_gemini:
@@ -105,19 +113,23 @@ class GoogleImagenProvider:
                 )
 
                 # Find image in response
-                image_data = None
-                for part in response.candidates[0].content.parts:
-                    if hasattr(part, "inline_data") and part.inline_data:
-                        image_data = part.inline_data.data
-                        break
+                gemini_image = next(
+                    (
+                        part.inline_data.data
+                        for part in response.candidates[0].content.parts
+                        if getattr(part, "inline_data", None)
+                    ),
+                    None,
+                )
 
-                if not image_data:
+                if not gemini_image:
                     return GenerationResult(
                         success=False,
                         provider=self.name,
                         content_type="image",
                         error="No image in Gemini response",
                     )
+                images = [gemini_image]
             else:
                 # Imagen 4
                 response = await client.aio.models.generate_images(
@@ -137,27 +149,43 @@ class GoogleImagenProvider:
                         error="No images generated",
                     )
 
-                image_data = response.generated_images[0].image.image_bytes
+                # One request returns the whole batch; keep every image
+                images = [generated.image.image_bytes for generated in response.generated_images]
 
             # Save
             if output_path:
-                file_path = Path(output_path)
+                base_path = Path(output_path)
             else:
-                output_dir = get_settings().output_dir
-                timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-                file_path = output_dir / f"imagen_{timestamp}.png"
+                output_dir = self._settings.output_dir
+                timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+                base_path = output_dir / f"imagen_{timestamp}.png"
 
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(image_data)
+            if len(images) == 1:
+                file_paths = [base_path]
+            else:
+                file_paths = [
+                    base_path.with_name(f"{base_path.stem}_{i}{base_path.suffix}")
+                    for i in range(len(images))
+                ]
+
+            await ensure_dir(base_path.parent)
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(path.write_bytes, data)
+                    for path, data in zip(file_paths, images, strict=True)
+                )
+            )
 
-            logger.info(f"✅ Imagen: Saved to {file_path}")
+            logger.info(f"✅ Imagen: Saved {len(file_paths)} image(s) to {base_path.parent}")
 
             return GenerationResult(
                 success=True,
                 provider=self.name,
                 content_type="image",
-                file_path=file_path,
-                data=image_data,
+                file_path=file_paths[0],
+                data=images[0],
+                file_paths=file_paths,
+                data_list=images,
                 metadata={
                     "aspect_ratio": aspect_ratio,
                     "model": model,
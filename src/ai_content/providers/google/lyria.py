@@ -6,8 +6,10 @@ Uses WebSocket streaming for real-time music generation.
 
 import asyncio
 import logging
-from datetime import datetime, timezone
+import struct
+import time
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 from ai_content.core.registry import ProviderRegistry
 from ai_content.core.result import GenerationResult
@@ -17,9 +19,117 @@ from ai_content.core.exceptions import (
     GenerationError,
 )
 from ai_content.config import get_settings
+from ai_content.providers.google.client import (
+    ensure_dir,
+    get_genai_client,
+    prewarm_genai_client,
+)
+
+try:
+    from google.genai import types
+except ImportError:
+    types = None  # reported by generate()
 
 logger = logging.getLogger(__name__)
 
+# Lyria RealTime streams raw 16-bit stereo PCM at 44.1kHz unless the
+# chunk's mime type says otherwise
+SAMPLE_RATE = 44100
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+
+# Extra time allowed past the requested duration for the byte target to arrive
+STREAM_GRACE_SECONDS = 5.0
+
+
+class AudioFormat(NamedTuple):
+    """PCM layout of a Lyria audio stream."""
+
+    channels: int = CHANNELS
+    sampwidth: int = SAMPLE_WIDTH
+    rate: int = SAMPLE_RATE
+
+    @property
+    def block_align(self) -> int:
+        """Bytes per frame."""
+        return self.channels * self.sampwidth
+
+
+DEFAULT_FORMAT = AudioFormat()
+
+
+def _parse_audio_format(mime_type: str | None) -> AudioFormat:
+    """
+    Read the PCM layout from a chunk mime type.
+
+    Example:
+        >>> _parse_audio_format("audio/l16;rate=48000;channels=2")
+        AudioFormat(channels=2, sampwidth=2, rate=48000)
+    """
+    if not mime_type:
+        return DEFAULT_FORMAT
+    media_type, *params = mime_type.lower().split(";")
+    fields = dict(param.strip().partition("=")[::2] for param in params)
+    # audio/l16, audio/l24: linear PCM with the bit depth in the subtype
+    subtype = media_type.rpartition("/")[2]
+    bits = int(subtype[1:]) if subtype[:1] == "l" and subtype[1:].isdigit() else None
+    return AudioFormat(
+        channels=int(fields.get("channels") or CHANNELS),
+        sampwidth=bits // 8 if bits else SAMPLE_WIDTH,
+        rate=int(fields.get("rate") or SAMPLE_RATE),
+    )
+
+
+def _wav_header(
+    nframes: int,
+    channels: int = CHANNELS,
+    sampwidth: int = SAMPLE_WIDTH,
+    rate: int = SAMPLE_RATE,
+) -> bytes:
+    """Build the 44-byte RIFF header for a PCM WAV file."""
+    block_align = channels * sampwidth
+    data_size = nframes * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        rate,
+        rate * block_align,  # byte rate
+        block_align,
+        sampwidth * 8,
+        b"data",
+        data_size,
+    )
+
+
+def _open_wav(path: Path, nframes: int) -> BinaryIO:
+    """Open a WAV file sized for nframes."""
+    wav_file = open(path, "wb")  # noqa: SIM115  (closed by _close_wav after streaming)
+    wav_file.write(_wav_header(nframes))
+    return wav_file
+
+
+def _close_wav(wav_file: BinaryIO, nframes: int, written: int, fmt: AudioFormat) -> None:
+    """
+    Close a WAV file opened by _open_wav.
+
+    The header is only rewritten when the stream used a different format or
+    came up short of nframes.
+    """
+    try:
+        frames = written // fmt.block_align
+        if fmt != DEFAULT_FORMAT or frames != nframes:
+            wav_file.truncate(44 + frames * fmt.block_align)
+            wav_file.seek(0)
+            wav_file.write(_wav_header(frames, *fmt))
+    finally:
+        wav_file.close()
+
 
 @ProviderRegistry.register_music("lyria")
 class GoogleLyriaProvider:
@@ -47,30 +157,28 @@ class GoogleLyriaProvider:
     supports_reference_audio = False
 
     def __init__(self):
-        self.settings = get_settings().google
-        self._client = None
+        self._settings = get_settings()
+        self.settings = self._settings.google
 
     def _get_client(self):
-        """Lazy-load the Google GenAI client."""
-        if self._client is None:
-            try:
-                from google import genai
-
-                api_key = self.settings.api_key
-                if not api_key:
-                    raise AuthenticationError("lyria")
-                # Lyria RealTime requires v1alpha API version
-                # https://ai.google.dev/gemini-api/docs/music-generation
-                self._client = genai.Client(
-                    api_key=api_key,
-                    http_options={"api_version": "v1alpha"},
-                )
-            except ImportError:
-                raise ProviderError(
-                    "lyria",
-                    "google-genai package not installed. Run: pip install google-genai",
-                )
-        return self._client
+        """Get the shared Google GenAI client for the running event loop."""
+        api_key = self.settings.api_key
+        if not api_key:
+            raise AuthenticationError("lyria")
+        # Lyria RealTime requires v1alpha API version
+        # https://ai.google.dev/gemini-api/docs/music-generation
+        try:
+            return get_genai_client(api_key, api_version="v1alpha")
+        except ImportError:
+            raise ProviderError(
+                "lyria",
+                "google-genai package not installed. Run: pip install google-genai",
+            )
+
+    @classmethod
+    async def prewarm(cls) -> None:
+        """Build the shared GenAI client ahead of the first generate() call."""
+        await prewarm_genai_client(get_settings().google.api_key, api_version="v1alpha")
 
     async def generate(
         self,
@@ -82,129 +190,157 @@ class GoogleLyriaProvider:
         reference_audio_url: str | None = None,
         output_path: str | None = None,
         temperature: float = 1.0,
+        return_bytes: bool = False,
     ) -> GenerationResult:
         """
         Generate music using Lyria RealTime streaming.
 
+        Audio is written to the WAV file as it arrives, so memory use stays
+        flat regardless of duration.
+
+        Args:
+            return_bytes: Also keep the raw PCM in `GenerationResult.data`
+
         Note:
             Lyria does not support vocals or lyrics. The lyrics parameter
             is ignored for compatibility with the MusicProvider protocol.
         """
-        from google.genai import types
+        if types is None:
+            raise ProviderError(
+                "lyria",
+                "google-genai package not installed. Run: pip install google-genai",
+            )
 
         client = self._get_client()
 
         logger.info(f"🎵 Lyria: Generating {duration_seconds}s at {bpm} BPM")
-        logger.debug(f"   Prompt: {prompt[:50]}...")
+        logger.debug("   Prompt: %.50s...", prompt)
 
         if lyrics:
             logger.warning("Lyria does not support vocals/lyrics. Ignoring lyrics parameter.")
 
-        audio_chunks: list[bytes] = []
-        capture_done = asyncio.Event()
-        chunk_count = 0
-
-        async def receive_audio(session):
-            """Receive audio from Lyria stream in dedicated coroutine."""
-            nonlocal chunk_count
-            try:
-                async for message in session.receive():
-                    if hasattr(message, "server_content") and message.server_content:
-                        if hasattr(message.server_content, "audio_chunks"):
-                            for chunk in message.server_content.audio_chunks:
-                                if hasattr(chunk, "data") and chunk.data:
-                                    audio_chunks.append(chunk.data)
-                                    chunk_count += 1
-                    await asyncio.sleep(0)  # Yield control
-                    if capture_done.is_set():
-                        break
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.error(f"Audio receive error: {e}")
+        if output_path:
+            file_path = Path(output_path)
+        else:
+            output_dir = self._settings.output_dir
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+            file_path = output_dir / f"lyria_{timestamp}.wav"
 
+        audio_buf = bytearray() if return_bytes else None
+        chunk_count = 0
+        received = 0
+        # Assume the default format until the first chunk says otherwise
+        audio_format = None
+        target_frames = int(duration_seconds * SAMPLE_RATE)
+        target_bytes = target_frames * DEFAULT_FORMAT.block_align
+
+        async def receive_audio(session, wav_file):
+            """Receive audio from Lyria stream and write it to the WAV file."""
+            nonlocal chunk_count, received, audio_format, target_bytes
+            async for message in session.receive():
+                server_content = getattr(message, "server_content", None)
+                for chunk in getattr(server_content, "audio_chunks", None) or ():
+                    chunk_data = getattr(chunk, "data", None)
+                    if not chunk_data:
+                        continue
+                    if audio_format is None:
+                        audio_format = _parse_audio_format(getattr(chunk, "mime_type", None))
+                        target_bytes = (
+                            int(duration_seconds * audio_format.rate)
+                            * audio_format.block_align
+                        )
+                    # Trim the chunk that crosses the target
+                    data = memoryview(chunk_data)[: target_bytes - received]
+                    wav_file.write(data)
+                    if audio_buf is not None:
+                        audio_buf.extend(data)
+                    received += len(data)
+                    chunk_count += 1
+                if received >= target_bytes:
+                    break
+
+        error = None
+        wav_file = None
         try:
+            # The header is written up front for the target length and only
+            # rewritten on close if the stream came up short. Opening and
+            # closing hit the disk, so both run off the event loop.
+            await ensure_dir(file_path.parent)
+            wav_file = await asyncio.to_thread(_open_wav, file_path, target_frames)
             async with client.aio.live.music.connect(model=self.settings.music_model) as session:
                 logger.info("   ✓ Connection established")
 
-                # Start receiver task first
-                receive_task = asyncio.create_task(receive_audio(session))
-
-                # Set weighted prompts
-                await session.set_weighted_prompts(
-                    prompts=[types.WeightedPrompt(text=prompt, weight=1.0)]
-                )
-                logger.info("   ✓ Prompt configured")
-
-                # Configure generation
-                await session.set_music_generation_config(
-                    config=types.LiveMusicGenerationConfig(
-                        bpm=bpm,
-                        temperature=temperature,
-                    )
-                )
-                logger.info(f"   ✓ Config set (BPM={bpm})")
-
-                # Start streaming
-                await session.play()
-                logger.info(f"   ▶ Streaming for {duration_seconds}s...")
-
-                # Wait for duration (robust: uses asyncio.sleep)
-                await asyncio.sleep(duration_seconds)
-
-                # Stop cleanly
-                logger.info(f"   ⏸ Stopping... ({chunk_count} chunks received)")
-                capture_done.set()
-                await session.stop()
-                receive_task.cancel()
+                # The group cancels the receiver if setup fails and re-raises
+                # receiver errors here instead of leaving an orphaned task
                 try:
-                    await receive_task
-                except asyncio.CancelledError:
-                    pass
+                    async with asyncio.TaskGroup() as tg:
+                        # Start receiver task first
+                        receive_task = tg.create_task(receive_audio(session, wav_file))
+
+                        # Set weighted prompts
+                        await session.set_weighted_prompts(
+                            prompts=[types.WeightedPrompt(text=prompt, weight=1.0)]
+                        )
+                        logger.info("   ✓ Prompt configured")
+
+                        # Configure generation
+                        await session.set_music_generation_config(
+                            config=types.LiveMusicGenerationConfig(
+                                bpm=bpm,
+                                temperature=temperature,
+                            )
+                        )
+                        logger.info(f"   ✓ Config set (BPM={bpm})")
+
+                        # Start streaming
+                        await session.play()
+                        logger.info(f"   ▶ Streaming for {duration_seconds}s...")
+
+                        # The receiver returns once it has the target byte count or
+                        # the stream ends; bound the wait by duration plus grace
+                        await asyncio.wait(
+                            {receive_task}, timeout=duration_seconds + STREAM_GRACE_SECONDS
+                        )
+
+                        # Stop cleanly
+                        logger.info(f"   ⏸ Stopping... ({chunk_count} chunks received)")
+                        await session.stop()
+                        receive_task.cancel()
+                except* Exception as eg:
+                    first = eg.exceptions[0]
+                    raise GenerationError(
+                        self.name, f"Audio stream failed: {first}", cause=first
+                    ) from first
 
         except Exception as e:
             logger.error(f"Lyria generation failed: {e}")
-            return GenerationResult(
-                success=False,
-                provider=self.name,
-                content_type="music",
-                error=str(e),
-            )
+            error = str(e)
+        finally:
+            if wav_file is not None:
+                await asyncio.to_thread(
+                    _close_wav,
+                    wav_file,
+                    target_frames,
+                    received,
+                    audio_format or DEFAULT_FORMAT,
+                )
 
-        if not audio_chunks:
+        if error is None and not chunk_count:
+            error = "No audio data received"
+        if error is not None:
+            await asyncio.to_thread(file_path.unlink, missing_ok=True)
             return GenerationResult(
                 success=False,
                 provider=self.name,
                 content_type="music",
-                error="No audio data received",
+                error=error,
             )
 
-        # Combine audio chunks
-        audio_data = b"".join(audio_chunks)
-
-        # Save if output path provided
-        file_path = None
-        if output_path:
-            file_path = Path(output_path)
-        else:
-            output_dir = get_settings().output_dir
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-            file_path = output_dir / f"lyria_{timestamp}.wav"
-
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write valid WAV file
-        import wave
-        try:
-            with wave.open(str(file_path), "wb") as wav_file:
-                wav_file.setnchannels(2)  # Stereo
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(44100)  # 44.1kHz
-                wav_file.writeframes(audio_data)
-        except Exception as e:
-            logger.error(f"Failed to write WAV header: {e}")
-            # Fallback to raw writing if wave module fails
-            file_path.write_bytes(audio_data)
+        # The stream can end early or time out; report what was actually written
+        fmt = audio_format or DEFAULT_FORMAT
+        if received < target_bytes:
+            logger.warning(f"   Stream short: {received}/{target_bytes} bytes received")
+        actual_duration = received // fmt.block_align / fmt.rate
 
         logger.info(f"✅ Lyria: Saved to {file_path}")
 
@@ -213,11 +349,13 @@ class GoogleLyriaProvider:
             provider=self.name,
             content_type="music",
             file_path=file_path,
-            data=audio_data,
-            duration_seconds=duration_seconds,
+            data=bytes(audio_buf) if audio_buf is not None else None,
+            duration_seconds=actual_duration,
             metadata={
                 "bpm": bpm,
                 "temperature": temperature,
                 "prompt": prompt,
+                "sample_rate": fmt.rate,
+                "channels": fmt.channels,
             },
         )
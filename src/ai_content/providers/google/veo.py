@@ -17,6 +17,7 @@ from ai_content.core.exceptions import (
     TimeoutError,
 )
 from ai_content.config import get_settings
+from ai_content.providers.google.client import get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -45,25 +46,21 @@ class GoogleVeoProvider:
     max_duration_seconds = 8
 
     def __init__(self):
-        self.settings = get_settings().google
-        self._client = None
+        self._settings = get_settings()
+        self.settings = self._settings.google
 
     def _get_client(self):
-        """Lazy-load the Google GenAI client."""
-        if self._client is None:
-            try:
-                from google import genai
-
-                api_key = self.settings.api_key
-                if not api_key:
-                    raise AuthenticationError("veo")
-                self._client = genai.Client(api_key=api_key)
-            except ImportError:
-                raise ProviderError(
-                    "veo",
-                    "google-genai package not installed. Run: pip install google-genai",
-                )
-        return self._client
+        """Get the shared Google GenAI client for the running event loop."""
+        api_key = self.settings.api_key
+        if not api_key:
+            raise AuthenticationError("veo")
+        try:
+            return get_genai_client(api_key)
+        except ImportError:
+            raise ProviderError(
+                "veo",
+                "google-genai package not installed. Run: pip install google-genai",
+            )
 
     async def generate(
         self,
@@ -149,7 +146,7 @@ class GoogleVeoProvider:
             if output_path:
                 file_path = Path(output_path)
             else:
-                output_dir = get_settings().output_dir
+                output_dir = self._settings.output_dir
                 timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
                 file_path = output_dir / f"veo_{timestamp}.mp4"
 